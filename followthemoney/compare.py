@@ -31,7 +31,7 @@ def compare(model, left, right):
     """Compare two entities and return a match score."""
     left = model.get_proxy(left)
     right = model.get_proxy(right)
-    if right.schema not in list(left.schema.matchable_schemata):
+    if right.schema not in left.schema.matchable_schemata:
         return 0
     schema = model.common_schema(left.schema, right.schema)
     score = compare_names(left, right) * NAMES_WEIGHT
@@ -29,7 +29,7 @@ class Model(object):
             # FIXME: stubs are not correctly assigned
             for schema in prop.schema.descendants:
                 if prop.name not in schema.properties:
-                    schema.properties[prop.name] = prop
+                    schema._add_property(prop)
 
     def _load(self, filepath):
         with open(filepath, "r", encoding="utf-8") as fh:
@@ -37,7 +37,8 @@ class Model(object):
             if not isinstance(data, dict):
                 raise InvalidModel("Model file is not a mapping: %s" % filepath)
             for name, config in data.items():
-                self.schemata[name] = Schema(self, name, config)
+                schema = Schema(self, name, config)
+                self.schemata[schema.name] = schema
 
     def get(self, name):
         if isinstance(name, Schema):
@@ -1,3 +1,4 @@
+import sys
 from rdflib import URIRef  # type: ignore
 from banal import is_mapping
 from normality import stringify
@@ -14,7 +15,7 @@ class Property(object):
         self.schema = schema
         self.model = schema.model
 
-        self.name = stringify(name)
+        self.name = sys.intern(stringify(name))
         self.qname = "%s:%s" % (schema.name, self.name)
         if self.name in self.RESERVED:
             raise InvalidModel("Reserved name: %s" % self.name)
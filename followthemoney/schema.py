@@ -1,10 +1,11 @@
+import sys
 from rdflib import URIRef  # type: ignore
 from banal import ensure_list, ensure_dict, as_bool
 
 from followthemoney.property import Property
 from followthemoney.types import registry
 from followthemoney.exc import InvalidData, InvalidModel
-from followthemoney.util import gettext, NS
+from followthemoney.util import gettext, get_model_locale, NS
 
 
 class Schema(object):
@@ -13,10 +14,51 @@ class Schema(object):
     Schema items define the entities available in the model.
     """
 
+    __slots__ = (
+        "model",
+        "name",
+        "_hash",
+        "data",
+        "_translations",
+        "_label",
+        "_plural",
+        "_description",
+        "uri",
+        "abstract",
+        "hidden",
+        "generated",
+        "matchable",
+        "featured",
+        "_featured_set",
+        "required",
+        "_required_set",
+        "caption",
+        "_caption_set",
+        "edge_source",
+        "edge_target",
+        "edge",
+        "edge_caption",
+        "_edge_label",
+        "edge_directed",
+        "extends",
+        "schemata",
+        "names",
+        "descendants",
+        "properties",
+        "_sorted_properties",
+        "_matchable_schemata",
+        "_dict_cache",
+        "_names_sorted",
+        "_extends_names_sorted",
+        "_generated",
+    )
+
     def __init__(self, model, name, data):
         self.model = model
-        self.name = name
+        self.name = sys.intern(name)
+        self._hash = hash(name)
         self.data = data
+        self._translations = {}
         self._label = data.get("label", name)
         self._plural = data.get("plural", self.label)
         self._description = data.get("description")
@@ -37,24 +79,27 @@ class Schema(object):
 
         # Mark a set of properties as important, i.e. they should be shown
         # first, or in an abridged view of the entity.
-        self.featured = ensure_list(data.get("featured"))
+        self.featured = [sys.intern(n) for n in ensure_list(data.get("featured"))]
+        self._featured_set = frozenset(self.featured)
 
         # Mark a set of properties as required. This is applied only when
         # an entity is created by the user - bulk created entities will
         # slip through even if it is technically invalid.
-        self.required = ensure_list(data.get("required"))
+        self.required = [sys.intern(n) for n in ensure_list(data.get("required"))]
+        self._required_set = frozenset(self.required)
 
         # Mark a set of properties to be used for the entity's caption.
         # They will be checked in order and the first existant value will
         # be used.
-        self.caption = ensure_list(data.get("caption"))
+        self.caption = [sys.intern(n) for n in ensure_list(data.get("caption"))]
+        self._caption_set = frozenset(self.caption)
 
         # A transform of the entity into an edge for its representation in
         # the context of a property graph representation like Neo4J/Gephi.
         edge = data.get("edge", {})
         self.edge_source = edge.get("source")
         self.edge_target = edge.get("target")
-        self.edge = self.edge_source and self.edge_target
+        self.edge = bool(self.edge_source and self.edge_target)
         self.edge_caption = ensure_list(edge.get("caption"))
         self._edge_label = edge.get("label", self._label)
         self.edge_directed = edge.get("directed", True)
@@ -63,18 +108,38 @@ class Schema(object):
         self.schemata = set([self])
         self.names = set([self.name])
         self.descendants = set()
+        self._names_sorted = (self.name,)
+        self._extends_names_sorted = ()
         self.properties = {}
+        self._generated = False
+        self._sorted_properties = {}
+        self._matchable_schemata = None
+        self._dict_cache = {}
         for name, prop in data.get("properties", {}).items():
-            self.properties[name] = Property(self, name, prop)
+            # Property names are interned by the property, so that lookups
+            # of common names can match keys by identity:
+            prop = Property(self, name, prop)
+            self.properties[prop.name] = prop
 
     def generate(self):
-        for parent in ensure_list(self.data.get("extends")):
-            parent = self.model.get(parent)
+        # Parents are generated by each of their children, but only
+        # need to be processed once.
+        if self._generated:
+            return
+
+        parents = []
+        for name in ensure_list(self.data.get("extends")):
+            parent = self.model.get(name)
+            if parent is None:
+                raise InvalidModel("Missing parent schema: %s" % name)
+            parents.append(parent)
+
+        for parent in parents:
             parent.generate()
 
             for name, prop in parent.properties.items():
                 if name not in self.properties:
-                    self.properties[name] = prop
+                    self._add_property(prop)
 
             self.extends.add(parent)
             for ancestor in parent.schemata:
@@ -82,6 +147,9 @@ class Schema(object):
                 self.names.add(ancestor.name)
                 ancestor.descendants.add(self)
 
+        self._names_sorted = tuple(sorted(self.names))
+        self._extends_names_sorted = tuple(sorted(e.name for e in self.extends))
+
         for prop in list(self.properties.values()):
             prop.generate()
 
@@ -106,6 +174,11 @@ class Schema(object):
                 msg = "Missing edge target: %s" % self.edge_target
                 raise InvalidModel(msg)
 
+        # The ancestry of a schema does not change once generated:
+        self.schemata = frozenset(self.schemata)
+        self.names = frozenset(self.names)
+        self._generated = True
+
     def _add_reverse(self, data, other):
         name = data.get("name", None)
         if name is None:
@@ -124,24 +197,43 @@ class Schema(object):
             data["hidden"] = data.get("hidden", other.hidden)
             prop = Property(self, name, data)
             prop.generate()
-            self.properties[name] = prop
+            self._add_property(prop)
         return prop
 
+    def _add_property(self, prop):
+        # Adding a property after load invalidates the memoized views:
+        self.properties[prop.name] = prop
+        self._sorted_properties = {}
+        self._dict_cache = {}
+
+    def _gettext(self, text):
+        # Translations are looked up once per model locale and then
+        # kept on the schema, so the cache needs no reset when the
+        # locale is changed.
+        if text is None:
+            return None
+        key = (get_model_locale(), text)
+        value = self._translations.get(key)
+        if value is None:
+            value = gettext(text)
+            self._translations[key] = value
+        return value
+
     @property
     def label(self):
-        return gettext(self._label)
+        return self._gettext(self._label)
 
     @property
     def plural(self):
-        return gettext(self._plural)
+        return self._gettext(self._plural)
 
     @property
     def description(self):
-        return gettext(self._description)
+        return self._gettext(self._description)
 
     @property
     def edge_label(self):
-        return gettext(self._edge_label)
+        return self._gettext(self._edge_label)
 
     @property
     def source_prop(self):
@@ -153,63 +245,109 @@ class Schema(object):
 
     @property
     def sorted_properties(self):
-        return sorted(
-            self.properties.values(),
-            key=lambda p: (
-                p.name not in self.caption,
-                p.name not in self.featured,
-                p.label,
-            ),
-        )
+        # The sort order depends on the translated property labels, so
+        # it is cached once per model locale.
+        locale = get_model_locale()
+        props = self._sorted_properties.get(locale)
+        if props is None:
+            caption, featured = self._caption_set, self._featured_set
+            props = tuple(
+                sorted(
+                    self.properties.values(),
+                    key=lambda p: (
+                        p.name not in caption,
+                        p.name not in featured,
+                        p.label,
+                    ),
+                )
+            )
+            self._sorted_properties[locale] = props
+        return props
 
     @property
     def matchable_schemata(self):
         """The set of comparable types."""
-        if not self.matchable:
-            return
-        # This is used by the cross-referencer to determine what
-        # other schemata should be considered for matches. For
-        # example, a Company may be compared to a Legal Entity,
-        # but it makes no sense to compare it to an Aircraft.
-        matchable = set(self.schemata)
-        matchable.update(self.descendants)
-        for schema in matchable:
-            if schema.matchable:
-                yield schema
+        if self._matchable_schemata is None:
+            # This is used by the cross-referencer to determine what
+            # other schemata should be considered for matches. For
+            # example, a Company may be compared to a Legal Entity,
+            # but it makes no sense to compare it to an Aircraft.
+            matchable = ()
+            if self.matchable:
+                schemata = set(self.schemata)
+                schemata.update(self.descendants)
+                matchable = tuple(s for s in schemata if s.matchable)
+            self._matchable_schemata = matchable
+        return self._matchable_schemata
 
     def is_a(self, parent):
-        return parent in self.schemata
+        # Check against the set of names so that the parent can be
+        # given either as a schema or as a schema name.
+        if isinstance(parent, Schema):
+            parent = parent.name
+        return parent in self.names
 
     def get(self, name):
         return self.properties.get(name)
 
+    def _property_errors(self, data):
+        errors = {}
+        properties = data.get("properties")
+        if type(properties) is not dict:
+            properties = ensure_dict(properties)
+        for name, values in properties.items():
+            prop = self.properties.get(name)
+            if prop is None:
+                continue
+            if type(values) is not list:
+                values = ensure_list(values)
+            if len(values):
+                error = prop.validate(values)
+                if error is not None:
+                    errors[name] = error
+        for name in self._required_set:
+            if not len(ensure_list(properties.get(name))):
+                errors[name] = gettext("Required")
+        return errors
+
     def validate(self, data):
         """Validate a dataset against the given schema.
         This will also drop keys which are not present as properties.
         """
-        errors = {}
-        properties = ensure_dict(data.get("properties"))
-        for name, prop in self.properties.items():
-            values = ensure_list(properties.get(name))
-            error = prop.validate(values)
-            if error is None and not len(values):
-                if prop.name in self.required:
-                    error = gettext("Required")
-            if error is not None:
-                errors[name] = error
+        errors = self._property_errors(data)
         if len(errors):
             msg = gettext("Entity validation failed")
             raise InvalidData(msg, errors={"properties": errors})
 
+    def validate_many(self, records):
+        """Validate a series of datasets against the given schema. All of
+        the records are checked, and a single error is raised which holds
+        the property errors of each invalid record, keyed by its position.
+        """
+        errors = {}
+        for index, data in enumerate(records):
+            record_errors = self._property_errors(data)
+            if len(record_errors):
+                errors[index] = {"properties": record_errors}
+        if len(errors):
+            msg = gettext("Entity validation failed")
+            raise InvalidData(msg, errors=errors)
+
     def to_dict(self):
+        """Serialise the schema. The result is cached for each model locale
+        and shared between callers, so it must not be modified."""
+        locale = get_model_locale()
+        data = self._dict_cache.get(locale)
+        if data is not None:
+            return data
         data = {
             "label": self.label,
             "plural": self.plural,
-            "schemata": list(sorted(self.names)),
-            "extends": list(sorted([e.name for e in self.extends])),
+            "schemata": list(self._names_sorted),
+            "extends": list(self._extends_names_sorted),
             "properties": {},
         }
-        if self.edge_source and self.edge_target:
+        if self.edge:
             data["edge"] = {
                 "source": self.edge_source,
                 "target": self.edge_target,
@@ -236,16 +374,21 @@ class Schema(object):
         for name, prop in self.properties.items():
             if prop.schema == self:
                 data["properties"][name] = prop.to_dict()
+        self._dict_cache[locale] = data
         return data
 
     def __eq__(self, other):
-        return hash(other) == hash(self)
+        # Schemata are compared by name, and may also be compared to
+        # a plain schema name string.
+        if other.__class__ is Schema:
+            return other.name == self.name
+        return other == self.name
 
     def __lt__(self, other):
         return self.name.__lt__(other.name)
 
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
 
     def __repr__(self):
         return "<Schema(%r)>" % self.name
@@ -36,6 +36,10 @@ def set_model_locale(locale):
     )
 
 
+def get_model_locale():
+    return getattr(state, "locale", DEFAULT_LOCALE)
+
+
 def get_locale():
     if not hasattr(state, "locale"):
         return Locale(DEFAULT_LOCALE)
@@ -1,8 +1,12 @@
+import os
+import shutil
+from tempfile import mkdtemp
 from nose.tools import assert_raises
 from unittest import TestCase
-from followthemoney import model
+from followthemoney import model, set_model_locale
+from followthemoney.model import Model
 from followthemoney.types import registry
-from followthemoney.exc import InvalidData
+from followthemoney.exc import InvalidData, InvalidModel
 
 
 class ModelTestCase(TestCase):
@@ -37,6 +41,17 @@ class ModelTestCase(TestCase):
         assert model.get("BankAccount") in schema, schema
         assert model.get("CourtCase") not in schema, schema
 
+    def test_model_missing_parent(self):
+        path = mkdtemp()
+        try:
+            with open(os.path.join(path, "Foo.yaml"), "w") as fh:
+                fh.write("Foo:\n  extends:\n    - Thingy\n")
+            with self.assertRaises(InvalidModel) as ctx:
+                Model(path)
+            assert "Thingy" in str(ctx.exception), ctx.exception
+        finally:
+            shutil.rmtree(path)
+
     def test_schema_basics(self):
         thing = model.schemata["Thing"]
         assert "Thing" in repr(thing), repr(thing)
@@ -50,6 +65,10 @@ class ModelTestCase(TestCase):
         person = model["Person"]
         assert 1 == len(list(person.extends)), list(person.extends)
         assert "Thing" in person.names, person.names
+        assert person != thing, person
+        assert person == "Person", person
+        assert person != "Thing", person
+        assert hash(person) == hash(model["Person"]), person
 
         ownership = model["Ownership"]
         owner = ownership.get("owner")
@@ -57,15 +76,36 @@ class ModelTestCase(TestCase):
         assert owner.reverse is not None
         role = ownership.get("role")
         assert role.reverse is None
+        assert ownership.edge is True, ownership.edge
+        assert thing.edge is False, thing.edge
 
     def test_schema_validate(self):
         thing = model.schemata["Thing"]
         data = {"properties": {"name": ["Banana"]}}
         thing.validate(data)
+        data = {"properties": {"name": ["Banana"], "banana": ["Yellow"]}}
+        thing.validate(data)
 
         with self.assertRaises(InvalidData):
             thing.validate({"properties": {"name": None}})
 
+        ownership = model.schemata["Ownership"]
+        with self.assertRaises(InvalidData) as ctx:
+            ownership.validate({"properties": {"owner": ["a"]}})
+        errors = ctx.exception.errors["properties"]
+        assert "asset" in errors, errors
+        assert "owner" not in errors, errors
+
+        ownership.validate_many([])
+        valid = {"properties": {"owner": ["a"], "asset": ["b"]}}
+        ownership.validate_many([valid, valid])
+        with self.assertRaises(InvalidData) as ctx:
+            ownership.validate_many([valid, {"properties": {}}, valid])
+        errors = ctx.exception.errors
+        assert list(errors.keys()) == [1], errors
+        assert "owner" in errors[1]["properties"], errors
+        assert "asset" in errors[1]["properties"], errors
+
     def test_model_common_schema(self):
         assert model.common_schema("Thing", "Thing") == "Thing"
         assert model.common_schema("Thing", "Person") == "Person"
@@ -92,6 +132,19 @@ class ModelTestCase(TestCase):
         assert model["LegalEntity"].is_a("Vessel") is False
         assert model["Vessel"].is_a("LegalEntity") is False
         assert model["Ownership"].is_a("LegalEntity") is False
+        assert model["Company"].is_a(model["LegalEntity"]) is True
+        assert model["LegalEntity"].is_a(model["Company"]) is False
+
+    def test_schema_label_locale(self):
+        person = model.schemata["Person"]
+        assert person.plural == "People", person.plural
+        try:
+            set_model_locale("de")
+            assert person.plural == "Personen", person.plural
+            assert person.to_dict()["plural"] == "Personen", person.to_dict()
+        finally:
+            set_model_locale("en")
+        assert person.plural == "People", person.plural
 
     def test_make_entity(self):
         ent = model.make_entity("Person")
@@ -103,6 +156,7 @@ class ModelTestCase(TestCase):
         data = thing.to_dict()
         assert data["label"] == thing.label, data
         assert len(data["properties"]) == len(list(thing.properties)), data
+        assert thing.to_dict() is data, data
 
     def test_model_property(self):
         thing = model.schemata["Thing"]
@@ -146,6 +200,7 @@ class ModelTestCase(TestCase):
         assert company in matchable, matchable
         assert le in matchable, matchable
         assert doc not in matchable, matchable
+        assert company.matchable_schemata is company.matchable_schemata
 
     def test_specificity_name(self):
         company = model.schemata["Company"]
@@ -173,3 +228,5 @@ class ModelTestCase(TestCase):
 
         sprops = list(directorship.sorted_properties)
         assert len(sprops) == len(directorship.properties), sprops
+        assert sprops[0] == directorship.get("role"), sprops
+        assert directorship.sorted_properties is directorship.sorted_properties